@@ -3,13 +3,25 @@
 
 const BASE_PATH = import.meta.env.BASE_URL || '/';
 
-export async function fetchJson<T>(path: string): Promise<T> {
+// 정적 JSON은 배포 단위로만 바뀌므로 경로별 응답을 세션 동안 재사용
+// (반환 배열을 직접 변경하지 말 것)
+const jsonCache = new Map<string, Promise<unknown>>();
+
+export function fetchJson<T>(path: string): Promise<T> {
+  const cached = jsonCache.get(path);
+  if (cached) return cached as Promise<T>;
+
   const url = `${BASE_PATH}data/${path}`.replace(/\/+/g, '/');
-  const res = await fetch(url);
-  if (!res.ok) {
-    throw new Error(`Failed to fetch ${path}`);
-  }
-  return res.json();
+  const pending = fetch(url).then((res) => {
+    if (!res.ok) {
+      throw new Error(`Failed to fetch ${path}`);
+    }
+    return res.json();
+  });
+  // 실패한 요청은 캐시에 남기지 않아 다음 호출에서 재시도
+  pending.catch(() => jsonCache.delete(path));
+  jsonCache.set(path, pending);
+  return pending as Promise<T>;
 }
 
 // Publications
@@ -17,12 +29,27 @@ export async function getPublications() {
   return fetchJson<any[]>('publications.json');
 }
 
+// 논문 목록 공통 정렬: 연도 내림차순 → displayOrder → 제목 → id
+// (홈/연구 페이지가 같은 순서를 쓰도록 공유)
+type PublicationOrderKey = {
+  year?: number | string;
+  displayOrder?: number | null;
+  title?: string | null;
+  id: string | number;
+};
+
+export function comparePublications(a: PublicationOrderKey, b: PublicationOrderKey) {
+  return (
+    (Number(b.year) || 0) - (Number(a.year) || 0) ||
+    (a.displayOrder ?? 0) - (b.displayOrder ?? 0) ||
+    (a.title || "").localeCompare(b.title || "") ||
+    String(a.id).localeCompare(String(b.id))
+  );
+}
+
 export async function getRecentPublications(limit: number = 5) {
   const pubs = await getPublications();
-  // 연도별 정렬 후 최근 것 반환
-  return pubs
-    .sort((a, b) => (b.year || 0) - (a.year || 0))
-    .slice(0, limit);
+  return [...pubs].sort(comparePublications).slice(0, limit);
 }
 
 // Members
@@ -36,16 +63,30 @@ export async function getMembers() {
 }
 
 // News
+// publishedAt 내림차순, 같으면 id 내림차순
+function compareNews(
+  a: { publishedAt: string; id: string },
+  b: { publishedAt: string; id: string }
+) {
+  return (
+    new Date(b.publishedAt).getTime() - new Date(a.publishedAt).getTime() ||
+    String(b.id).localeCompare(String(a.id))
+  );
+}
+
 export async function getNews() {
   const news = await fetchJson<any[]>('news.json');
-  // publishedAt 기준 정렬
-  return news.sort((a, b) =>
-    new Date(b.publishedAt).getTime() - new Date(a.publishedAt).getTime()
-  );
+  return [...news].sort(compareNews);
 }
 
-export async function getNewsById(id: string) {
+export async function getRecentNews(limit: number = 3) {
   const news = await getNews();
+  return news.slice(0, limit);
+}
+
+export async function getNewsById(id: string) {
+  // 단건 조회는 정렬이 필요 없으므로 원본 목록에서 바로 찾음
+  const news = await fetchJson<any[]>('news.json');
   return news.find(n => n.id === id) || null;
 }
 
@@ -34,7 +34,7 @@ export default function PublicationsSection() {
       getRecentPublications(8)
         .then((json) => {
           if (!cancelled) {
-            setData(Array.isArray(json) ? json : []);
+            setData(json);
             setLoading(false);
           }
         })
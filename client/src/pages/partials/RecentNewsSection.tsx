@@ -1,7 +1,7 @@
 // src/pages/partials/RecentNewsSection.tsx
 import { useEffect, useLayoutEffect, useState } from "react";
 import { Link } from "wouter";
-import { getNews } from "@/lib/staticApi";
+import { getRecentNews } from "@/lib/staticApi";
 
 export default function RecentNewsSection() {
   const [reveal, setReveal] = useState(false);
@@ -10,8 +10,7 @@ export default function RecentNewsSection() {
   useEffect(() => {
     const refetch = async () => {
       try {
-        const news = await getNews();
-        setNewsData(news.slice(0, 3));
+        setNewsData(await getRecentNews(3));
       } catch (e) {
         console.error("Failed to fetch news:", e);
         setNewsData([]);
@@ -1,7 +1,7 @@
 // client/src/pages/research.tsx
 import { useEffect, useMemo, useState } from "react";
 import { Card, CardHeader, CardTitle, CardContent } from "@/components/ui/card";
-import { getPublications, getResearchAreas } from "@/lib/staticApi";
+import { comparePublications, getPublications, getResearchAreas } from "@/lib/staticApi";
 import PublicationCard from "@/components/publication-card";
 
 type Publication = {
@@ -62,23 +62,14 @@ export default function ResearchPage() {
   }, []);
 
   const groupedPubs = useMemo(() => {
+    // 전체를 한 번 정렬한 뒤 연도별로 묶음 (Map 삽입 순서 = 연도 내림차순)
     const m = new Map<number, Publication[]>();
-    publications.forEach((p) => {
+    [...publications].sort(comparePublications).forEach((p) => {
       const y = Number(p.year);
       if (!m.has(y)) m.set(y, []);
       m.get(y)!.push(p);
     });
-    return Array.from(m.entries())
-      .sort((a, b) => b[0] - a[0])
-      .map(([year, list]) => ({
-        year,
-        list: list.sort((a, b) => {
-          const orderA = a.displayOrder ?? 0;
-          const orderB = b.displayOrder ?? 0;
-          if (orderA !== orderB) return orderA - orderB;
-          return (a.title || "").localeCompare(b.title || "");
-        }),
-      }));
+    return Array.from(m.entries()).map(([year, list]) => ({ year, list }));
   }, [publications]);
 
   return (